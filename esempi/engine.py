@@ -1,32 +1,47 @@
 "for running these via key board one chars hortcuts write a while loop that prints the input"
+import codecs
+import os
 import sys
 
-def _read_char():
-    """Read a single character (cross-platform)."""
-    try:
-        import msvcrt
-        return msvcrt.getwch()  # Windows
-    except ImportError:
-        import tty, termios
-        fd = sys.stdin.fileno()
-        old = termios.tcgetattr(fd)
-        try:
-            tty.setraw(fd)
-            ch = sys.stdin.read(1)
-            if ch == '\x1b': # arrow keys
-                ch += sys.stdin.read(2)
-            return ch
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old)
+try:
+    import msvcrt  # Windows
+except ImportError:
+    msvcrt = None
+    import termios
+    import tty
 
-def run_key_loop():
-    print("Press keys (press 'q' to quit).")
+def _run_windows_loop():
     while True:
-        c = _read_char()
+        c = msvcrt.getwch()
         print("Got:", repr(c))
         if c == 'q':
             break
 
+def run_key_loop():
+    print("Press keys (press 'q' to quit).")
+    if msvcrt is not None:
+        return _run_windows_loop()
+    # enter raw mode once for the whole loop; each read returns a keypress,
+    # an escape sequence (arrow keys) or a paste burst of up to 8 bytes
+    fd = sys.stdin.fileno()
+    old = termios.tcgetattr(fd)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    try:
+        tty.setraw(fd)
+        while True:
+            data = os.read(fd, 8)
+            if not data:  # EOF
+                break
+            c = decoder.decode(data)
+            if not c:  # partial UTF-8 sequence, wait for the rest
+                continue
+            # raw mode disables newline translation, so emit \r\n ourselves
+            print("Got:", repr(c), end="\r\n", flush=True)
+            if c == 'q':
+                break
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+
 if __name__ == "__main__":
     run_key_loop()
 
@@ -1,5 +1,4 @@
 import numpy as np
-import random
 import time
 from enum import Enum, auto
 
@@ -10,6 +9,37 @@ class State(Enum):
     SPRAY_FEATURES = auto()
     DONE = auto()
 
+# Operand shape for generated features, and op name -> (label, batched op).
+FEATURE_SHAPE = (4, 4)
+FEATURE_OPS = {
+    'add': ("element-wise addition", np.add),
+    'multiply': ("element-wise multiplication", np.multiply),
+    'dot': ("dot product", lambda a, b: np.matmul(a, b.transpose(0, 2, 1))),
+    'mean': ("mean", lambda a, b: np.mean(a, axis=(1, 2))),
+    'std': ("standard deviation", lambda a, b: np.std(a, axis=(1, 2))),
+}
+
+# Number of values pre-drawn per random pool refill.
+RANDOM_POOL_SIZE = 1024
+
+class _RandomPool:
+    """Ring buffer of pre-drawn random values, refilled in one call when used up."""
+    def __init__(self, draw, size=RANDOM_POOL_SIZE):
+        self._draw = draw
+        self._size = size
+        self._refill()
+
+    def _refill(self):
+        self._values = self._draw(self._size).tolist()
+        self._pos = 0
+
+    def next(self):
+        if self._pos == self._size:
+            self._refill()
+        value = self._values[self._pos]
+        self._pos += 1
+        return value
+
 class DeveloperStateMachine:
     """
     A state machine simulating a developer's workflow, including distractions.
@@ -17,24 +47,35 @@ class DeveloperStateMachine:
     def __init__(self):
         self.state = State.JIRA_BOARD
         self.task = None
+        self._rng = np.random.default_rng()
+        rng = self._rng
+        self._ticket_ids = _RandomPool(lambda n: rng.integers(100, 1000, n))
+        self._attempt_rolls = _RandomPool(rng.random)
+        self._feature_counts = _RandomPool(lambda n: rng.integers(1, 4, n))
+        self._feature_ops = _RandomPool(lambda n: rng.choice(list(FEATURE_OPS), n))
+        self._dispatch = {
+            State.JIRA_BOARD: self._handle_jira_board,
+            State.ATTEMPT_SOLUTION: self._handle_attempt_solution,
+            State.SPRAY_FEATURES: self._handle_spray_features,
+        }
         print("--- Starting Developer Workflow Simulation ---")
 
-    def run(self):
-        """Runs the state machine until it reaches the DONE state."""
+    def run(self, delay=1.0):
+        """Runs the state machine until it reaches the DONE state.
+
+        Pass delay=0 to skip the pause between states (e.g. when benchmarking).
+        """
+        dispatch = self._dispatch
         while self.state != State.DONE:
-            if self.state == State.JIRA_BOARD:
-                self._handle_jira_board()
-            elif self.state == State.ATTEMPT_SOLUTION:
-                self._handle_attempt_solution()
-            elif self.state == State.SPRAY_FEATURES:
-                self._handle_spray_features()
-            time.sleep(1)
+            dispatch[self.state]()
+            if delay:
+                time.sleep(delay)
         print("--- Workflow Complete. Developer is resting. ---")
 
     def _handle_jira_board(self):
         """State for browsing the Jira board."""
         print("\n[STATE: JIRA_BOARD]")
-        self.task = f"JIRA-TICKET-{random.randint(100, 999)}"
+        self.task = f"JIRA-TICKET-{self._ticket_ids.next()}"
         print(f"Selected task: {self.task}")
         self.state = State.ATTEMPT_SOLUTION
 
@@ -44,7 +85,7 @@ class DeveloperStateMachine:
         print("Thinking really hard...")
         
         # Decide the outcome of the attempt
-        if random.random() < 0.4:  # 40% chance of success
+        if self._attempt_rolls.next() < 0.4:  # 40% chance of success
             print(f"Success! {self.task} has been resolved.")
             self.state = State.DONE
         else: # 60% chance of getting distracted
@@ -54,45 +95,30 @@ class DeveloperStateMachine:
     def _handle_spray_features(self):
         """State for getting distracted and adding random features."""
         print("\n[STATE: SPRAY_FEATURES] - Entering creative mode!")
-        num_features = random.randint(1, 3)
+        num_features = self._feature_counts.next()
         print(f"Implementing {num_features} new 'essential' feature(s)...")
 
-        for i in range(num_features):
-            self._generate_feature(i + 1)
+        self._generate_features(num_features)
 
         print("Okay, that's enough features for now. Back to the board.")
         self.state = State.JIRA_BOARD
 
-    def _generate_feature(self, feature_num):
-        """Generates a 'feature' using a random numpy operation."""
-        op = random.choice(['add', 'multiply', 'dot', 'mean', 'std'])
-        dim1, dim2 = random.randint(2, 4), random.randint(2, 4)
-        a = np.random.rand(dim1, dim2) * 100
-        b = np.random.rand(dim1, dim2) * 100
-        
-        result = None
-        op_str = ""
-
-        print(f"\n  Feature #{feature_num}: Applying a random numpy operation.")
-        if op == 'add':
-            result = np.add(a, b)
-            op_str = "element-wise addition"
-        elif op == 'multiply':
-            result = np.multiply(a, b)
-            op_str = "element-wise multiplication"
-        elif op == 'dot':
-            # Ensure dimensions are compatible for dot product
-            b = np.random.rand(dim2, dim1) * 100
-            result = np.dot(a, b)
-            op_str = "dot product"
-        elif op == 'mean':
-            result = np.mean(a)
-            op_str = "mean"
-        elif op == 'std':
-            result = np.std(a)
-            op_str = "standard deviation"
-        
-        print(f"  New feature implemented: '{op_str}'. Result sample: {np.ravel(result)[0]:.2f}")
+    def _generate_features(self, num_features):
+        """Generates 'features' using random numpy operations on one batch.
+
+        All operands are drawn as a single (num_features, 4, 4) stack and each
+        chosen operation runs once over the whole stack.
+        """
+        ops = [self._feature_ops.next() for _ in range(num_features)]
+        a = self._rng.random((num_features, *FEATURE_SHAPE)) * 100
+        b = self._rng.random((num_features, *FEATURE_SHAPE)) * 100
+        results = {op: FEATURE_OPS[op][1](a, b) for op in set(ops)}
+
+        for i, op in enumerate(ops):
+            op_str = FEATURE_OPS[op][0]
+            sample = np.ravel(results[op][i])[0]
+            print(f"\n  Feature #{i + 1}: Applying a random numpy operation.")
+            print(f"  New feature implemented: '{op_str}'. Result sample: {sample:.2f}")
 
 
 if __name__ == "__main__":
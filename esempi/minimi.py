@@ -1,34 +1,96 @@
-from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Optional, Any
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Any, Set, Tuple
+from array import array
+import bisect
+import functools
 import json
-import itertools
 import datetime
+import time
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encode/decode when installed
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional: typed C-level decoding in import_board
+    msgspec = None
+
+try:
+    import numpy as np
+except ImportError:  # optional: issue_columns returns numpy arrays when installed
+    np = None
+
+
+# (millisecond tick, formatted timestamp) of the last _now_iso() call
+_now_cache = (-1, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time in ISO-8601, formatted at most once per millisecond."""
+    global _now_cache
+    ms = time.time_ns() // 1_000_000
+    cached_ms, cached_iso = _now_cache
+    if ms == cached_ms:
+        return cached_iso
+    now = datetime.datetime.fromtimestamp(ms // 1000, datetime.timezone.utc)
+    iso = now.replace(microsecond=(ms % 1000) * 1000).isoformat(
+        timespec="milliseconds"
+    )
+    _now_cache = (ms, iso)
+    return iso
 
 
-_id_counter = itertools.count(1)
-
+@functools.lru_cache(maxsize=None)
+def _issue_filter(by_status: bool, by_assignee: bool, by_labels: bool):
+    """
+    Build a list_issues predicate factory specialized to the filters in use.
 
-def _next_id() -> int:
-    return next(_id_counter)
+    Only the filter shape is compiled; the values are bound as closure
+    variables by calling the returned factory, so no data reaches exec().
+    """
+    checks = []
+    if by_status:
+        checks.append("i.status == status")
+    if by_assignee:
+        checks.append("i.assignee_id == assignee_id")
+    if by_labels:
+        checks.append("labels <= i._label_set")
+    src = (
+        "def bind(status, assignee_id, labels):\n"
+        "    def matches(i):\n"
+        f"        return {' and '.join(checks) or 'True'}\n"
+        "    return matches\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(src, namespace)
+    return namespace["bind"]
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: int
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Comment:
     id: int
     author_id: int
     body: str
-    created_at: str = field(
-        default_factory=lambda: datetime.datetime.utcnow().isoformat()
-    )
+    created_at: str = field(default_factory=_now_iso)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "author_id": self.author_id,
+            "body": self.body,
+            "created_at": self.created_at,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     id: int
     title: str
@@ -38,15 +100,81 @@ class Issue:
     labels: List[str] = field(default_factory=list)
     priority: int = 100  # lower is higher priority
     comments: List[Comment] = field(default_factory=list)
-    created_at: str = field(
-        default_factory=lambda: datetime.datetime.utcnow().isoformat()
-    )
-    updated_at: str = field(
-        default_factory=lambda: datetime.datetime.utcnow().isoformat()
-    )
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = ""  # defaults to created_at
+    # lowercase copies used by search_issues
+    _title_lc: str = field(init=False, repr=False, compare=False)
+    _desc_lc: str = field(init=False, repr=False, compare=False)
+    # membership view of labels, kept in sync by BoardManager
+    _label_set: Set[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.updated_at:
+            self.updated_at = self.created_at
+        self._refresh_search_text()
+        self._label_set = set(self.labels)
+
+    def _refresh_search_text(self) -> None:
+        # title/description may be None (or anything else) on updated or
+        # imported issues; those simply never match a search
+        title, desc = self.title, self.description
+        self._title_lc = title.lower() if isinstance(title, str) else ""
+        self._desc_lc = desc.lower() if isinstance(desc, str) else ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "status": self.status,
+            "assignee_id": self.assignee_id,
+            "labels": list(self.labels),
+            "priority": self.priority,
+            "comments": [c.to_dict() for c in self.comments],
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
 
+# Issue fields update_issue refuses: id keys board.issues and the indices
+_ISSUE_READONLY_FIELDS = frozenset({"id"})
 
-@dataclass
+# public Issue fields that update_issue may set
+_ISSUE_FIELDS = frozenset(
+    name
+    for name in Issue.__dataclass_fields__
+    if not name.startswith("_") and name not in _ISSUE_READONLY_FIELDS
+)
+
+
+def _check_indexable(
+    status: Any, assignee_id: Any, labels: List[Any], priority: Any
+) -> None:
+    """
+    Raise if the values cannot go into the BoardManager indices: TypeError
+    for unhashable keys or a non-numeric priority, ValueError for a NaN
+    priority. Called before any state changes so a bad value never leaves
+    an issue half-indexed.
+    """
+    hash(status)
+    hash(assignee_id)
+    for label in labels:
+        hash(label)
+    if not isinstance(priority, (int, float)):
+        raise TypeError(f"priority must be a number, got {priority!r}")
+    if priority != priority:
+        raise ValueError("priority must not be NaN")
+
+
+def _typed_column(values: List[Any], typecode: str) -> Optional[array]:
+    """Pack values into array(typecode), or None if any value does not fit."""
+    try:
+        return array(typecode, values)
+    except (TypeError, OverflowError):
+        return None
+
+
+@dataclass(slots=True)
 class Sprint:
     id: int
     name: str
@@ -54,41 +182,202 @@ class Sprint:
     end_at: Optional[str] = None
     issues: List[int] = field(default_factory=list)
     active: bool = False
+    # membership view of issues, kept in sync by BoardManager
+    _issue_set: Set[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._issue_set = set(self.issues)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "start_at": self.start_at,
+            "end_at": self.end_at,
+            "issues": list(self.issues),
+            "active": self.active,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class Board:
     id: int
     name: str
     projects: List[str] = field(default_factory=list)
     issues: Dict[int, Issue] = field(default_factory=dict)
     sprints: Dict[int, Sprint] = field(default_factory=dict)
+    # membership view of projects, kept in sync by BoardManager
+    _project_set: Set[str] = field(init=False, repr=False, compare=False)
+    # issue_id -> ids of the sprints containing it, kept in sync by BoardManager
+    _issue_to_sprints: Dict[int, Set[int]] = field(
+        init=False, repr=False, compare=False
+    )
+    # issue_id -> insertion position, so filtered results keep board order
+    _positions: Dict[int, int] = field(init=False, repr=False, compare=False)
+    _next_position: int = field(init=False, repr=False, compare=False)
+    # export cache, invalidated by BoardManager mutators
+    _cached_json: Dict[Optional[int], str] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _issue_cache: Dict[int, Dict[str, Any]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._project_set = set(self.projects)
+        self._issue_to_sprints = {}
+        for sid, sprint in self.sprints.items():
+            for iid in sprint.issues:
+                self._issue_to_sprints.setdefault(iid, set()).add(sid)
+        self._positions = {iid: pos for pos, iid in enumerate(self.issues)}
+        self._next_position = len(self._positions)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._to_dict({iid: i.to_dict() for iid, i in self.issues.items()})
+
+    def _export_dict(self) -> Dict[str, Any]:
+        """Like to_dict, but reuses cached dicts for unchanged issues.
+
+        The cached dicts are shared between exports, so the result is only
+        handed to the JSON encoder and never returned to callers.
+        """
+        cache = self._issue_cache
+        issues = {}
+        for iid, issue in self.issues.items():
+            data = cache.get(iid)
+            if data is None:
+                data = cache[iid] = issue.to_dict()
+            issues[iid] = data
+        return self._to_dict(issues)
+
+    def _to_dict(self, issues: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "projects": list(self.projects),
+            "issues": issues,
+            "sprints": {sid: s.to_dict() for sid, s in self.sprints.items()},
+        }
+
+
+if msgspec is not None:
+    # wire schema for import_board; mirrors the dicts produced by to_dict().
+    # Only the structure is typed: values are Any and keys are decoded as
+    # strings and passed through int(), exactly like _board_from_payload, so
+    # installing msgspec never changes which payloads import or their data.
+
+    class _CommentMsg(msgspec.Struct):
+        id: Any
+        author_id: Any
+        body: Any
+        created_at: Any = None
+
+    class _IssueMsg(msgspec.Struct):
+        title: Any
+        description: Any = ""
+        status: Any = "todo"
+        assignee_id: Any = None
+        labels: Any = []
+        priority: Any = 100
+        comments: List[_CommentMsg] = []
+        created_at: Any = None
+        updated_at: Any = None
+
+    class _SprintMsg(msgspec.Struct):
+        name: Any
+        start_at: Any = None
+        end_at: Any = None
+        issues: Any = []
+        active: Any = False
+
+    class _BoardMsg(msgspec.Struct):
+        name: Any
+        id: Any = None
+        projects: Any = []
+        issues: Dict[str, _IssueMsg] = {}
+        sprints: Dict[str, _SprintMsg] = {}
+
+    _board_decoder = msgspec.json.Decoder(_BoardMsg)
+else:
+    _board_decoder = None
 
 
 class BoardManager:
     """
     Simple in-memory manager that implements core operations for a Linear/Jira-like board.
     Designed for unit testing and as a foundation for API handlers or persistence later.
+    Mutate boards through the manager so indices and export caches stay in sync.
     """
 
     def __init__(self):
         self.boards: Dict[int, Board] = {}
         self.users: Dict[int, User] = {}
+        # last id handed out; boards, users, issues, comments and sprints
+        # share one id space
+        self._next_id_value: int = 0
+        # secondary indices keyed by (board_id, value) -> issue ids
+        self._by_status: Dict[Tuple[int, str], Set[int]] = {}
+        self._by_assignee: Dict[Tuple[int, int], Set[int]] = {}
+        self._by_label: Dict[Tuple[int, str], Set[int]] = {}
+        # board_id -> sorted (priority, board position, issue_id) entries
+        self._by_priority: Dict[int, List[Tuple[int, int]]] = {}
+
+    def _next_id(self) -> int:
+        self._next_id_value += 1
+        return self._next_id_value
+
+    # -- index maintenance
+    def _index_issue(self, board: Board, issue: Issue) -> None:
+        board_id = board.id
+        self._by_status.setdefault((board_id, issue.status), set()).add(issue.id)
+        if issue.assignee_id is not None:
+            self._by_assignee.setdefault((board_id, issue.assignee_id), set()).add(
+                issue.id
+            )
+        for label in issue.labels:
+            self._by_label.setdefault((board_id, label), set()).add(issue.id)
+        bisect.insort(
+            self._by_priority.setdefault(board_id, []),
+            (issue.priority, board._positions[issue.id], issue.id),
+        )
+
+    def _unindex_issue(self, board: Board, issue: Issue) -> None:
+        board_id = board.id
+        self._by_status.get((board_id, issue.status), set()).discard(issue.id)
+        if issue.assignee_id is not None:
+            self._by_assignee.get((board_id, issue.assignee_id), set()).discard(
+                issue.id
+            )
+        for label in issue.labels:
+            self._by_label.get((board_id, label), set()).discard(issue.id)
+        ranked = self._by_priority.get(board_id, [])
+        key = (issue.priority, board._positions[issue.id], issue.id)
+        pos = bisect.bisect_left(ranked, key)
+        if pos < len(ranked) and ranked[pos] == key:
+            del ranked[pos]
+
+    def _touch(self, board: Board, issue_id: Optional[int] = None) -> None:
+        """Drop the board's cached exports after a mutation."""
+        board._cached_json.clear()
+        if issue_id is not None:
+            board._issue_cache.pop(issue_id, None)
 
     # -- board/project lifecycle
     def create_board(self, name: str) -> Board:
-        b = Board(id=_next_id(), name=name)
+        b = Board(id=self._next_id(), name=name)
         self.boards[b.id] = b
         return b
 
     def add_project(self, board_id: int, project_name: str) -> None:
         board = self.boards[board_id]
-        if project_name not in board.projects:
+        if project_name not in board._project_set:
+            board._project_set.add(project_name)
             board.projects.append(project_name)
+            self._touch(board)
 
     # -- user management
     def create_user(self, name: str) -> User:
-        u = User(id=_next_id(), name=name)
+        u = User(id=self._next_id(), name=name)
         self.users[u.id] = u
         return u
 
@@ -103,35 +392,68 @@ class BoardManager:
         priority: int = 100,
     ) -> Issue:
         board = self.boards[board_id]
+        labels = list(labels or ())
+        _check_indexable("todo", assignee_id, labels, priority)
         issue = Issue(
-            id=_next_id(),
+            id=self._next_id(),
             title=title,
             description=description,
             assignee_id=assignee_id,
-            labels=labels or [],
+            labels=labels,
             priority=priority,
         )
         board.issues[issue.id] = issue
+        board._positions[issue.id] = board._next_position
+        board._next_position += 1
+        self._index_issue(board, issue)
+        self._touch(board)
         return issue
 
     def get_issue(self, board_id: int, issue_id: int) -> Issue:
         return self.boards[board_id].issues[issue_id]
 
     def update_issue(self, board_id: int, issue_id: int, **fields) -> Issue:
-        issue = self.get_issue(board_id, issue_id)
-        for k, v in fields.items():
-            if hasattr(issue, k):
-                setattr(issue, k, v)
-        issue.updated_at = datetime.datetime.utcnow().isoformat()
+        readonly = _ISSUE_READONLY_FIELDS.intersection(fields)
+        if readonly:
+            raise ValueError(
+                f"update_issue cannot change {', '.join(sorted(readonly))}"
+            )
+        board = self.boards[board_id]
+        issue = board.issues[issue_id]
+        updates = {k: v for k, v in fields.items() if k in _ISSUE_FIELDS}
+        if "labels" in updates:
+            updates["labels"] = list(updates["labels"] or ())
+        # validate before unindexing so a bad value leaves the issue untouched
+        _check_indexable(
+            updates.get("status", issue.status),
+            updates.get("assignee_id", issue.assignee_id),
+            updates.get("labels", issue.labels),
+            updates.get("priority", issue.priority),
+        )
+        self._unindex_issue(board, issue)
+        for k, v in updates.items():
+            setattr(issue, k, v)
+        if "title" in updates or "description" in updates:
+            issue._refresh_search_text()
+        if "labels" in updates:
+            issue._label_set = set(issue.labels)
+        self._index_issue(board, issue)
+        issue.updated_at = _now_iso()
+        self._touch(board, issue_id)
         return issue
 
     def delete_issue(self, board_id: int, issue_id: int) -> None:
         board = self.boards[board_id]
-        board.issues.pop(issue_id, None)
-        # remove from sprints if present
-        for sprint in board.sprints.values():
-            if issue_id in sprint.issues:
-                sprint.issues.remove(issue_id)
+        issue = board.issues.pop(issue_id, None)
+        if issue is not None:
+            self._unindex_issue(board, issue)
+        board._positions.pop(issue_id, None)
+        # remove from the sprints that contain it
+        for sid in board._issue_to_sprints.pop(issue_id, ()):
+            sprint = board.sprints[sid]
+            sprint._issue_set.discard(issue_id)
+            sprint.issues.remove(issue_id)
+        self._touch(board, issue_id)
 
     def list_issues(
         self,
@@ -140,16 +462,47 @@ class BoardManager:
         assignee_id: Optional[int] = None,
         labels: Optional[List[str]] = None,
         sort_by_priority: bool = False,
+        limit: Optional[int] = None,
     ) -> List[Issue]:
-        issues = list(self.boards[board_id].issues.values())
+        board = self.boards[board_id]
+        # gather the index buckets for each provided filter and start from the
+        # smallest one; the remaining filters are checked per candidate
+        buckets = []
         if status:
-            issues = [i for i in issues if i.status == status]
+            buckets.append(self._by_status.get((board_id, status), set()))
         if assignee_id is not None:
-            issues = [i for i in issues if i.assignee_id == assignee_id]
-        if labels:
-            issues = [i for i in issues if all(l in i.labels for l in labels)]
-        if sort_by_priority:
-            issues.sort(key=lambda i: i.priority)
+            buckets.append(self._by_assignee.get((board_id, assignee_id), set()))
+        for label in labels or ():
+            buckets.append(self._by_label.get((board_id, label), set()))
+        if buckets:
+            candidates = min(buckets, key=len)
+            matches = _issue_filter(
+                bool(status), assignee_id is not None, bool(labels)
+            )(status, assignee_id, frozenset(labels or ()))
+            # keep board (insertion) order: scan the board when the bucket is
+            # large, otherwise order the bucket by recorded position
+            if 2 * len(candidates) >= len(board.issues):
+                ordered = (i for iid, i in board.issues.items() if iid in candidates)
+            else:
+                by_id = board.issues
+                ordered = (
+                    by_id[iid]
+                    for iid in sorted(candidates, key=board._positions.__getitem__)
+                )
+            issues = [issue for issue in ordered if matches(issue)]
+            if sort_by_priority:
+                position = board._positions
+                issues.sort(key=lambda i: (i.priority, position[i.id]))
+        elif sort_by_priority:
+            # walk the priority index so only the requested head is touched
+            ranked = self._by_priority.get(board_id, [])
+            if limit is not None:
+                ranked = ranked[:limit]
+            return [board.issues[iid] for _, _, iid in ranked]
+        else:
+            issues = list(board.issues.values())
+        if limit is not None:
+            del issues[limit:]
         return issues
 
     # -- assignment, labels, comments
@@ -160,25 +513,32 @@ class BoardManager:
 
     def add_label(self, board_id: int, issue_id: int, label: str) -> Issue:
         issue = self.get_issue(board_id, issue_id)
-        if label not in issue.labels:
+        if label not in issue._label_set:
+            issue._label_set.add(label)
             issue.labels.append(label)
-            issue.updated_at = datetime.datetime.utcnow().isoformat()
+            self._by_label.setdefault((board_id, label), set()).add(issue_id)
+            issue.updated_at = _now_iso()
+            self._touch(self.boards[board_id], issue_id)
         return issue
 
     def remove_label(self, board_id: int, issue_id: int, label: str) -> Issue:
         issue = self.get_issue(board_id, issue_id)
-        if label in issue.labels:
+        if label in issue._label_set:
+            issue._label_set.discard(label)
             issue.labels.remove(label)
-            issue.updated_at = datetime.datetime.utcnow().isoformat()
+            self._by_label.get((board_id, label), set()).discard(issue_id)
+            issue.updated_at = _now_iso()
+            self._touch(self.boards[board_id], issue_id)
         return issue
 
     def add_comment(
         self, board_id: int, issue_id: int, author_id: int, body: str
     ) -> Comment:
         issue = self.get_issue(board_id, issue_id)
-        c = Comment(id=_next_id(), author_id=author_id, body=body)
+        c = Comment(id=self._next_id(), author_id=author_id, body=body)
         issue.comments.append(c)
-        issue.updated_at = datetime.datetime.utcnow().isoformat()
+        issue.updated_at = _now_iso()
+        self._touch(self.boards[board_id], issue_id)
         return c
 
     # -- workflow
@@ -191,36 +551,45 @@ class BoardManager:
     # -- sprints
     def create_sprint(self, board_id: int, name: str) -> Sprint:
         board = self.boards[board_id]
-        s = Sprint(id=_next_id(), name=name)
+        s = Sprint(id=self._next_id(), name=name)
         board.sprints[s.id] = s
+        self._touch(board)
         return s
 
     def add_issue_to_sprint(self, board_id: int, sprint_id: int, issue_id: int) -> None:
         board = self.boards[board_id]
         sprint = board.sprints[sprint_id]
-        if issue_id not in sprint.issues and issue_id in board.issues:
+        if issue_id not in sprint._issue_set and issue_id in board.issues:
+            sprint._issue_set.add(issue_id)
+            board._issue_to_sprints.setdefault(issue_id, set()).add(sprint_id)
             sprint.issues.append(issue_id)
+            self._touch(board)
 
     def remove_issue_from_sprint(
         self, board_id: int, sprint_id: int, issue_id: int
     ) -> None:
         board = self.boards[board_id]
         sprint = board.sprints[sprint_id]
-        if issue_id in sprint.issues:
+        if issue_id in sprint._issue_set:
+            sprint._issue_set.discard(issue_id)
+            board._issue_to_sprints.get(issue_id, set()).discard(sprint_id)
             sprint.issues.remove(issue_id)
+            self._touch(board)
 
     def start_sprint(self, board_id: int, sprint_id: int) -> Sprint:
         board = self.boards[board_id]
         sprint = board.sprints[sprint_id]
         sprint.active = True
-        sprint.start_at = sprint.start_at or datetime.datetime.utcnow().isoformat()
+        sprint.start_at = sprint.start_at or _now_iso()
+        self._touch(board)
         return sprint
 
     def close_sprint(self, board_id: int, sprint_id: int) -> Sprint:
         board = self.boards[board_id]
         sprint = board.sprints[sprint_id]
         sprint.active = False
-        sprint.end_at = datetime.datetime.utcnow().isoformat()
+        sprint.end_at = _now_iso()
+        self._touch(board)
         return sprint
 
     # -- search & export
@@ -229,54 +598,184 @@ class BoardManager:
         return [
             i
             for i in self.boards[board_id].issues.values()
-            if q in i.title.lower() or q in i.description.lower()
+            if q in i._title_lc or q in i._desc_lc
         ]
 
-    def export_board(self, board_id: int) -> str:
-        board = self.boards[board_id]
-        # convert dataclasses -> dict
-        serializable = {
-            "id": board.id,
-            "name": board.name,
-            "projects": board.projects,
-            "issues": {iid: asdict(issue) for iid, issue in board.issues.items()},
-            "sprints": {sid: asdict(s) for sid, s in board.sprints.items()},
+    def issue_columns(self, board_id: int) -> Dict[str, Any]:
+        """
+        Snapshot of the board's issues as parallel typed columns for bulk
+        analytics, built in one pass over the board.
+
+        Returns "id" and "priority" (int64, or float64 if any priority is a
+        float), "status" (uint32 codes into the "statuses" list) and
+        "assignee_id" (int64 with -1 when unassigned; if some assignee is not
+        an int the column holds the raw values, None when unassigned).
+        Columns are numpy arrays when numpy is installed, otherwise
+        array.array (or a list for non-int assignees).
+        """
+        issues = self.boards[board_id].issues.values()
+        codes: Dict[Any, int] = {}
+        status = array("I", [codes.setdefault(i.status, len(codes)) for i in issues])
+        ids = [i.id for i in issues]
+        priorities = [i.priority for i in issues]
+        assignees = [i.assignee_id for i in issues]
+        priority_col = _typed_column(priorities, "q")
+        if priority_col is None:
+            priority_col = array("d", priorities)
+        assignee_col: Any = _typed_column(
+            [-1 if a is None else a for a in assignees], "q"
+        )
+        if assignee_col is None:
+            assignee_col = assignees
+        id_col: Any = _typed_column(ids, "q")
+        if id_col is None:
+            id_col = ids
+        snapshot: Dict[str, Any] = {
+            "id": id_col,
+            "priority": priority_col,
+            "assignee_id": assignee_col,
+            "status": status,
         }
-        return json.dumps(serializable, indent=2)
-
-    def import_board(self, data: str) -> Board:
-        payload = json.loads(data)
-        board = Board(id=payload.get("id", _next_id()), name=payload["name"])
-        board.projects = payload.get("projects", [])
+        if np is not None:
+            for name, col in snapshot.items():
+                if isinstance(col, array):
+                    snapshot[name] = np.array(col)
+                else:
+                    snapshot[name] = np.array(col, dtype=object)
+        snapshot["statuses"] = list(codes)
+        return snapshot
+
+    def export_board(self, board_id: int, indent: Optional[int] = 2) -> str:
+        board = self.boards[board_id]
+        cached = board._cached_json.get(indent)
+        if cached is not None:
+            return cached
+        serializable = board._export_dict()
+        if orjson is not None and indent in (None, 2):
+            option = orjson.OPT_NON_STR_KEYS
+            if indent == 2:
+                option |= orjson.OPT_INDENT_2
+            out = orjson.dumps(serializable, option=option).decode()
+        elif indent is None:
+            out = json.dumps(serializable, separators=(",", ":"))
+        else:
+            out = json.dumps(serializable, indent=indent)
+        board._cached_json[indent] = out
+        return out
+
+    def _board_from_payload(self, payload: Dict[str, Any]) -> Board:
+        # one timestamp for every entry that lacks its own
+        now = _now_iso()
+        Issue_, Comment_, Sprint_ = Issue, Comment, Sprint
+        issues = {}
         for iid, idata in payload.get("issues", {}).items():
+            get = idata.get
             iid_int = int(iid)
-            issue = Issue(
+            issues[iid_int] = Issue_(
                 id=iid_int,
                 title=idata["title"],
-                description=idata.get("description", ""),
-                status=idata.get("status", "todo"),
-                assignee_id=idata.get("assignee_id"),
-                labels=idata.get("labels", []),
-                priority=idata.get("priority", 100),
-                comments=[Comment(**c) for c in idata.get("comments", [])],
-                created_at=idata.get(
-                    "created_at", datetime.datetime.utcnow().isoformat()
-                ),
-                updated_at=idata.get(
-                    "updated_at", datetime.datetime.utcnow().isoformat()
-                ),
+                description=get("description", ""),
+                status=get("status", "todo"),
+                assignee_id=get("assignee_id"),
+                labels=get("labels") or [],
+                priority=get("priority", 100),
+                # same rules as _board_from_msg: unknown comment keys are
+                # ignored and missing or null timestamps become `now`
+                comments=[
+                    Comment_(
+                        c["id"], c["author_id"], c["body"], c.get("created_at") or now
+                    )
+                    for c in get("comments", ())
+                ],
+                created_at=get("created_at") or now,
+                updated_at=get("updated_at") or now,
             )
-            board.issues[iid_int] = issue
+        sprints = {}
         for sid, sdata in payload.get("sprints", {}).items():
+            get = sdata.get
             sid_int = int(sid)
-            sprint = Sprint(
+            sprints[sid_int] = Sprint_(
                 id=sid_int,
                 name=sdata["name"],
-                start_at=sdata.get("start_at"),
-                end_at=sdata.get("end_at"),
-                issues=sdata.get("issues", []),
-                active=sdata.get("active", False),
+                start_at=get("start_at"),
+                end_at=get("end_at"),
+                issues=get("issues") or [],
+                active=get("active", False),
+            )
+        board_id = payload.get("id")
+        return Board(
+            id=board_id if board_id is not None else self._next_id(),
+            name=payload["name"],
+            projects=payload.get("projects", []),
+            issues=issues,
+            sprints=sprints,
+        )
+
+    def _board_from_msg(self, msg: "_BoardMsg") -> Board:
+        now = _now_iso()
+        Issue_, Comment_, Sprint_ = Issue, Comment, Sprint
+        issues = {
+            int(iid): Issue_(
+                id=int(iid),
+                title=m.title,
+                description=m.description,
+                status=m.status,
+                assignee_id=m.assignee_id,
+                labels=m.labels or [],
+                priority=m.priority,
+                comments=[
+                    Comment_(c.id, c.author_id, c.body, c.created_at or now)
+                    for c in m.comments
+                ],
+                created_at=m.created_at or now,
+                updated_at=m.updated_at or now,
+            )
+            for iid, m in msg.issues.items()
+        }
+        sprints = {
+            int(sid): Sprint_(
+                id=int(sid),
+                name=m.name,
+                start_at=m.start_at,
+                end_at=m.end_at,
+                issues=m.issues or [],
+                active=m.active,
             )
-            board.sprints[sid_int] = sprint
+            for sid, m in msg.sprints.items()
+        }
+        return Board(
+            id=msg.id if msg.id is not None else self._next_id(),
+            name=msg.name,
+            projects=msg.projects,
+            issues=issues,
+            sprints=sprints,
+        )
+
+    def import_board(self, data: str) -> Board:
+        if _board_decoder is not None:
+            board = self._board_from_msg(_board_decoder.decode(data))
+        else:
+            payload = orjson.loads(data) if orjson is not None else json.loads(data)
+            board = self._board_from_payload(payload)
+        issues, sprints = board.issues, board.sprints
+        # reject the whole payload before touching any manager state
+        for issue in issues.values():
+            _check_indexable(
+                issue.status, issue.assignee_id, issue.labels, issue.priority
+            )
+        # keep freshly allocated ids clear of the imported ones
+        self._next_id_value = max(
+            self._next_id_value,
+            board.id,
+            max(issues, default=0),
+            max((c.id for i in issues.values() for c in i.comments), default=0),
+            max(sprints, default=0),
+        )
+        previous = self.boards.get(board.id)
+        if previous is not None:
+            for issue in previous.issues.values():
+                self._unindex_issue(previous, issue)
+        for issue in board.issues.values():
+            self._index_issue(board, issue)
         self.boards[board.id] = board
         return board